@@ -202,7 +202,7 @@ async def dispatch_webhook(payment: Payment):
     """
     Dispatches the webhook to the webhook url.
     """
-    logger.debug("sending webhook", payment.webhook)
+    logger.debug("sending webhook: {}", payment.webhook)
 
     if not payment.webhook:
         return await mark_webhook_sent(payment.payment_hash, "-1")
@@ -5,19 +5,35 @@ from loguru import logger
 class WebsocketConnectionManager:
     def __init__(self) -> None:
         self.active_connections: list[WebSocket] = []
+        # index by item_id so a send only touches its listeners,
+        # websockets are not hashable so they are tracked by id()
+        self._by_item: dict[str, list[WebSocket]] = {}
+        self._item_ids: dict[int, str] = {}
 
     async def connect(self, websocket: WebSocket, item_id: str):
         logger.debug(f"Websocket connected to {item_id}")
         await websocket.accept()
         self.active_connections.append(websocket)
+        self._by_item.setdefault(item_id, []).append(websocket)
+        self._item_ids[id(websocket)] = item_id
 
     def disconnect(self, websocket: WebSocket):
         self.active_connections.remove(websocket)
+        item_id = self._item_ids.pop(id(websocket), None)
+        if item_id is None:
+            return
+        connections = [
+            ws for ws in self._by_item.get(item_id, []) if ws is not websocket
+        ]
+        if connections:
+            self._by_item[item_id] = connections
+        else:
+            self._by_item.pop(item_id, None)
 
     async def send_data(self, message: str, item_id: str):
-        for connection in self.active_connections:
-            if connection.path_params["item_id"] == item_id:
-                await connection.send_text(message)
+        # copy, the list can change while we are awaiting a send
+        for connection in list(self._by_item.get(item_id, [])):
+            await connection.send_text(message)
 
 
 websocket_manager = WebsocketConnectionManager()
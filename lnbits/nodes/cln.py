@@ -238,8 +238,10 @@ class CoreLightningNode(Node):
 
     @catch_rpc_errors
     async def get_channels(self) -> list[NodeChannel]:
-        channels = await self.ln_rpc("listpeerchannels")
-        nodes = await self.ln_rpc("listnodes")
+        channels, nodes = await asyncio.gather(
+            self.ln_rpc("listpeerchannels"),
+            self.ln_rpc("listnodes"),
+        )
         nodes_by_id = {n["nodeid"]: n for n in nodes["nodes"]}
 
         return [
@@ -267,10 +269,11 @@ class CoreLightningNode(Node):
 
     @catch_rpc_errors
     async def get_info(self) -> NodeInfoResponse:
-        info = await self.ln_rpc("getinfo")
-        funds = await self.ln_rpc("listfunds")
-
-        channels = await self.get_channels()
+        info, funds, channels = await asyncio.gather(
+            self.ln_rpc("getinfo"),
+            self.ln_rpc("listfunds"),
+            self.get_channels(),
+        )
         active_channels = [
             channel for channel in channels if channel.state == ChannelState.ACTIVE
         ]
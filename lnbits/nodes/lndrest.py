@@ -229,10 +229,10 @@ class LndRestNode(Node):
         peer_b64 = _encode_urlsafe_bytes(peer_id)
         channels = await self.get(f"/v1/channels?peer={peer_b64}")
         if "error" in channel_info and "error" in channels:
-            logger.debug("LND get_channel", channels)
+            logger.debug("LND get_channel: {}", channels)
             return None
         if len(channels["channels"]) == 0:
-            logger.debug(f"LND get_channel no channels founds with id {peer_b64}")
+            logger.debug("LND get_channel no channels founds with id {}", peer_b64)
             return None
         for channel in channels["channels"]:
             if channel["chan_id"] == channel_id:
@@ -342,8 +342,10 @@ class LndRestNode(Node):
         return channels
 
     async def get_public_info(self) -> PublicNodeInfo:
-        info = await self.get("/v1/getinfo")
-        channels = await self.get_channels()
+        info, channels = await asyncio.gather(
+            self.get("/v1/getinfo"),
+            self.get_channels(),
+        )
         return PublicNodeInfo(
             backend_name="LND",
             id=info["identity_pubkey"],
@@ -356,10 +358,12 @@ class LndRestNode(Node):
         )
 
     async def get_info(self) -> NodeInfoResponse:
-        public = await self.get_public_info()
-        onchain = await self.get("/v1/balance/blockchain")
-        fee_report = await self.get("/v1/fees")
-        balance = await self.get("/v1/balance/channels")
+        public, onchain, fee_report, balance = await asyncio.gather(
+            self.get_public_info(),
+            self.get("/v1/balance/blockchain"),
+            self.get("/v1/fees"),
+            self.get("/v1/balance/channels"),
+        )
         return NodeInfoResponse(
             **public.dict(),
             onchain_balance_sat=onchain["total_balance"],
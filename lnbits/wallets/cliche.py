@@ -178,7 +178,7 @@ class ClicheWallet(Wallet):
                 while settings.lnbits_running:
                     r = ws.recv()
                     data = json.loads(r)
-                    print(data)
+                    logger.debug("cliche invoice stream: {}", data)
                     try:
                         if data["result"]["status"]:
                             yield data["result"]["payment_hash"]
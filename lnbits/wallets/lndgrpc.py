@@ -60,6 +60,18 @@ def bytes_to_hex(b: bytes) -> str:
 # error when we communicate with the lnd rpc server.
 environ["GRPC_SSL_CIPHER_SUITES"] = "HIGH+ECDSA"
 
+# Keep the long lived invoice subscription alive through idle periods and
+# allow large responses (lnd recommends 50MB for listing rpcs).
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", 50 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# deadline in seconds for unary rpcs, so a stalled lnd can not hang a request
+RPC_TIMEOUT = 10
+
 
 class LndWallet(Wallet):
     def __init__(self):
@@ -89,26 +101,36 @@ class LndWallet(Wallet):
             self.macaroon = load_macaroon(macaroon, encrypted_macaroon)
         except ValueError as exc:
             raise ValueError(f"cannot load macaroon for LndWallet: {exc!s}") from exc
+        # built once, grpc calls metadata_callback for every rpc
+        self.metadata = (("macaroon", self.macaroon),)
 
         cert = open(cert_path, "rb").read()
         creds = grpc.ssl_channel_credentials(cert)
         auth_creds = grpc.metadata_call_credentials(self.metadata_callback)
         composite_creds = grpc.composite_channel_credentials(creds, auth_creds)
-        channel = grpc.aio.secure_channel(
-            f"{self.endpoint}:{self.port}", composite_creds
+        # one channel for the lifetime of the wallet, closed in cleanup()
+        self.channel = grpc.aio.secure_channel(
+            f"{self.endpoint}:{self.port}",
+            composite_creds,
+            options=GRPC_CHANNEL_OPTIONS,
         )
-        self.rpc = lnrpc.LightningStub(channel)
-        self.routerpc = routerrpc.RouterStub(channel)
+        self.rpc = lnrpc.LightningStub(self.channel)
+        self.routerpc = routerrpc.RouterStub(self.channel)
 
     def metadata_callback(self, _, callback):
-        callback([("macaroon", self.macaroon)], None)
+        callback(self.metadata, None)
 
     async def cleanup(self):
-        pass
+        try:
+            await self.channel.close()
+        except RuntimeError as e:
+            logger.warning(f"Error closing wallet connection: {e}")
 
     async def status(self) -> StatusResponse:
         try:
-            resp = await self.rpc.ChannelBalance(ln.ChannelBalanceRequest())
+            resp = await self.rpc.ChannelBalance(
+                ln.ChannelBalanceRequest(), timeout=RPC_TIMEOUT
+            )
         except Exception as exc:
             return StatusResponse(f"Unable to connect, got: '{exc}'", 0)
 
@@ -145,7 +167,7 @@ class LndWallet(Wallet):
         data["r_preimage"] = bytes.fromhex(preimage)
         try:
             req = ln.Invoice(**data)
-            resp = await self.rpc.AddInvoice(req)
+            resp = await self.rpc.AddInvoice(req, timeout=RPC_TIMEOUT)
             # response model
             # {
             #    "r_hash": <bytes>,
@@ -227,7 +249,9 @@ class LndWallet(Wallet):
                 # that use different checking_id formats
                 raise ValueError
 
-            resp = await self.rpc.LookupInvoice(ln.PaymentHash(r_hash=r_hash))
+            resp = await self.rpc.LookupInvoice(
+                ln.PaymentHash(r_hash=r_hash), timeout=RPC_TIMEOUT
+            )
             if resp.settled:
                 return PaymentSuccessStatus(preimage=resp.r_preimage.hex())
 
@@ -0,0 +1,63 @@
+import pytest
+
+from lnbits.core.services.websockets import WebsocketConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, item_id: str):
+        self.path_params = {"item_id": item_id}
+        self.sent: list[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+
+@pytest.mark.anyio
+async def test_send_data_only_reaches_item_listeners():
+    manager = WebsocketConnectionManager()
+    ws_a1 = FakeWebSocket("a")
+    ws_a2 = FakeWebSocket("a")
+    ws_b = FakeWebSocket("b")
+    for ws in (ws_a1, ws_a2, ws_b):
+        await manager.connect(ws, ws.path_params["item_id"])  # type: ignore
+
+    await manager.send_data("hello", "a")
+    await manager.send_data("nobody", "c")
+
+    assert ws_a1.sent == ["hello"]
+    assert ws_a2.sent == ["hello"]
+    assert ws_b.sent == []
+
+
+@pytest.mark.anyio
+async def test_disconnect_removes_empty_item():
+    manager = WebsocketConnectionManager()
+    ws = FakeWebSocket("a")
+    await manager.connect(ws, "a")  # type: ignore
+
+    manager.disconnect(ws)  # type: ignore
+
+    assert manager.active_connections == []
+    await manager.send_data("hello", "a")
+    assert ws.sent == []
+
+
+@pytest.mark.anyio
+async def test_disconnect_uses_connect_item_id():
+    manager = WebsocketConnectionManager()
+    # path param differs from the item_id the socket was registered under
+    ws = FakeWebSocket("path-id")
+    await manager.connect(ws, "other-id")  # type: ignore
+
+    await manager.send_data("hello", "other-id")
+    await manager.send_data("nobody", "path-id")
+    assert ws.sent == ["hello"]
+
+    manager.disconnect(ws)  # type: ignore
+
+    assert manager.active_connections == []
+    await manager.send_data("again", "other-id")
+    assert ws.sent == ["hello"]
@@ -82,12 +82,15 @@ def _check_calls(expected_calls):
             req = func_call["request_data"]
             args = req["args"] if "args" in req else {}
             kwargs = _eval_dict(req["kwargs"]) if "kwargs" in req else {}
+            call_kwargs = req["call_kwargs"] if "call_kwargs" in req else {}
 
             if "klass" in req:
                 *rest, cls = req["klass"].split(".")
                 req_module = importlib.import_module(".".join(rest))
                 req_class = getattr(req_module, cls)
-                func_call["spy"].assert_called_with(req_class(*args, **kwargs))
+                func_call["spy"].assert_called_with(
+                    req_class(*args, **kwargs), **call_kwargs
+                )
             else:
                 func_call["spy"].assert_called_with(*args, **kwargs)
 